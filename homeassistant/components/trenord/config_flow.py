@@ -0,0 +1,72 @@
+"""Config flow for the Trenord integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import aiohttp
+import voluptuous as vol
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResult
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import CONF_ARRIVAL_TIME, CONF_DEPARTURE_TIME, CONF_TRAIN_ID, DOMAIN
+from .trenord_apis import TrenordApi
+
+_LOGGER = logging.getLogger(__name__)
+
+STEP_USER_DATA_SCHEMA = vol.Schema({vol.Required(CONF_TRAIN_ID): str})
+
+
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+    """Validate that a train with the given id exists."""
+    api = TrenordApi(async_get_clientsession(hass))
+    train = await api.get_train(data[CONF_TRAIN_ID])
+
+    if train is None:
+        raise TrainNotFound
+
+    return {
+        CONF_NAME: train.name,
+        CONF_TRAIN_ID: data[CONF_TRAIN_ID],
+        CONF_DEPARTURE_TIME: int(train.departure_time.timestamp()),
+        CONF_ARRIVAL_TIME: int(train.arrival_time.timestamp()),
+    }
+
+
+class TrenordConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for Trenord."""
+
+    VERSION = 1
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the initial step."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                info = await validate_input(self.hass, user_input)
+            except TrainNotFound:
+                errors["base"] = "train_not_found"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.error("Error connecting to the Trenord APIs: %s", err)
+                errors["base"] = "cannot_connect"
+            else:
+                await self.async_set_unique_id(user_input[CONF_TRAIN_ID])
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(title=info[CONF_NAME], data=info)
+
+        return self.async_show_form(
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+
+class TrainNotFound(HomeAssistantError):
+    """Error to indicate the train does not exist."""
@@ -0,0 +1,7 @@
+"""Constants for the Trenord integration."""
+
+DOMAIN = "trenord"
+
+CONF_TRAIN_ID = "train_id"
+CONF_DEPARTURE_TIME = "departure_time"
+CONF_ARRIVAL_TIME = "arrival_time"
@@ -0,0 +1,270 @@
+"""Support for Trenord train sensors."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Final
+from zoneinfo import ZoneInfo
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_NAME, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import CONF_ARRIVAL_TIME, CONF_DEPARTURE_TIME, CONF_TRAIN_ID
+from .trenord_apis import TrainStatus, TrenordApi, TrenordTrain
+
+_LOGGER = logging.getLogger(__name__)
+
+_ROME = ZoneInfo("Europe/Rome")
+
+# Enum member names, computed once instead of per-member attribute
+# lookups in the class body.
+_STATUS_OPTIONS: Final = list(TrainStatus.__members__)
+
+# Poll every minute around and during the trip, every 15 minutes while
+# the train is idle for the rest of the day.
+_ACTIVE_INTERVAL = timedelta(seconds=60)
+_IDLE_INTERVAL = timedelta(minutes=15)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Trenord sensors from a config entry."""
+    coordinator = TrainUpdateCoordinator(hass, entry)
+    await coordinator.async_config_entry_first_refresh()
+
+    async_add_entities(
+        [
+            TrainSensorStatus(coordinator, entry),
+            TrainSensorDelay(coordinator, entry),
+            TrainSensorSuppression(coordinator, entry),
+        ]
+    )
+
+
+class TrainUpdateCoordinator(DataUpdateCoordinator[TrenordTrain]):
+    """Coordinator fetching a single Trenord train."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=entry.data[CONF_NAME],
+            update_interval=_ACTIVE_INTERVAL,
+        )
+        self.api = TrenordApi(async_get_clientsession(hass))
+        self.train_id: str = entry.data[CONF_TRAIN_ID]
+
+        self.departure_time: datetime = self._restore_datetime(
+            entry.data[CONF_DEPARTURE_TIME]
+        )
+        self.arrival_time: datetime = self._restore_datetime(
+            entry.data[CONF_ARRIVAL_TIME]
+        )
+        self._window_day: str | None = None
+        self._window_start_ts = 0.0
+        self._window_end_ts = 0.0
+        self._last_notified: tuple[TrenordTrain | None, bool] | None = None
+
+    @staticmethod
+    def _restore_datetime(value: float | str) -> datetime:
+        """Restore a stored schedule time into an aware datetime.
+
+        New entries store epoch seconds; entries created before that
+        hold ISO strings.
+        """
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return datetime.fromtimestamp(value, _ROME)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners only when the train data has actually changed.
+
+        The unchanged payload is by far the common case on a 60 second
+        poll cadence; skipping the callbacks avoids rewriting identical
+        state for all three sensors on every refresh.
+        """
+        if self._last_notified == (self.data, self.last_update_success):
+            return
+        self._last_notified = (self.data, self.last_update_success)
+        super().async_update_listeners()
+
+    async def _async_update_data(self) -> TrenordTrain | None:
+        """Fetch the latest data about the train."""
+        _LOGGER.debug("Refreshing train %s", self.name)
+
+        try:
+            if not self._is_polling_allowed():
+                return self.data
+
+            train = await self.api.get_train(self.train_id)
+
+            if train is None:
+                raise UpdateFailed(f"Train {self.train_id} not found")
+
+            self.departure_time = train.departure_time
+            self.arrival_time = train.arrival_time
+            self._window_day = None
+
+            return train
+        finally:
+            self.update_interval = self._next_update_interval()
+
+    def _schedule_window(self, now: datetime) -> tuple[datetime, datetime]:
+        """Return today's polling window around the train schedule."""
+        departure_time = self.departure_time.replace(
+            year=now.year, month=now.month, day=now.day
+        )
+        arrival_time = self.arrival_time.replace(
+            year=now.year, month=now.month, day=now.day
+        )
+        return departure_time - timedelta(minutes=30), arrival_time + timedelta(
+            minutes=10
+        )
+
+    def _next_update_interval(self) -> timedelta:
+        """Pick the refresh interval for the next poll.
+
+        Inside the schedule window the train is polled every minute;
+        outside of it the coordinator wakes at most every 15 minutes,
+        just often enough not to overshoot the start of the next
+        window.
+        """
+        now = datetime.now(_ROME)
+        window_start, window_end = self._schedule_window(now)
+
+        if window_start <= now <= window_end:
+            return _ACTIVE_INTERVAL
+
+        if now < window_start:
+            return min(_IDLE_INTERVAL, max(_ACTIVE_INTERVAL, window_start - now))
+
+        return _IDLE_INTERVAL
+
+    def _is_polling_allowed(self) -> bool:
+        """Check whether the train is within its daily schedule window."""
+        # The first refresh runs before any entity has subscribed, so only
+        # gate on listeners once there is data to serve them.
+        if self.data is not None and not self._listeners:
+            _LOGGER.debug("No listeners, skipping poll")
+            return False
+
+        now_ts = time.time()
+        now = datetime.now(_ROME)
+        if self._window_day != (today := now.date().isoformat()):
+            window_start, window_end = self._schedule_window(now)
+            self._window_day = today
+            self._window_start_ts = window_start.timestamp()
+            self._window_end_ts = window_end.timestamp()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Window for %s: %s - %s (now %s)",
+                    today,
+                    window_start,
+                    window_end,
+                    now,
+                )
+
+        return self._window_start_ts <= now_ts <= self._window_end_ts
+
+
+class TrainSensorBase(CoordinatorEntity[TrainUpdateCoordinator], SensorEntity):
+    """Base class for the sensors of a train."""
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the state from the coordinator once registered."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+
+class TrainSensorStatus(TrainSensorBase):
+    """Sensor exposing the overall status of a train."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = _STATUS_OPTIONS
+    _attr_icon = "mdi:train"
+
+    def __init__(self, coordinator: TrainUpdateCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}-status"
+        self._attr_name = entry.data[CONF_NAME]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if (train := self.coordinator.data) is None:
+            return
+
+        self._attr_name = train.name
+        self._attr_native_value = train.status.name
+        self.async_write_ha_state()
+
+
+class TrainSensorDelay(TrainSensorBase):
+    """Sensor exposing the delay of a train."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_icon = "mdi:clock-alert-outline"
+
+    def __init__(self, coordinator: TrainUpdateCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}-delay"
+        self._attr_name = f"{entry.data[CONF_NAME]} Delay"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if (train := self.coordinator.data) is None:
+            return
+
+        self._attr_name = f"{train.name} Delay"
+        if train.arrival_ts > time.time():
+            self._attr_native_value = train.delay
+        else:
+            self._attr_native_value = None
+        self.async_write_ha_state()
+
+
+class TrainSensorSuppression(TrainSensorBase):
+    """Sensor exposing the suppressed segment of a train journey, if any."""
+
+    _attr_icon = "mdi:cancel"
+
+    def __init__(self, coordinator: TrainUpdateCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}-suppression"
+        self._attr_name = f"{entry.data[CONF_NAME]} Suppression"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if (train := self.coordinator.data) is None:
+            return
+
+        self._attr_name = f"{train.name} Suppression"
+        if train.suppression is not None and train.arrival_ts > time.time():
+            self._attr_native_value = (
+                f"{train.suppression.from_station_name} - "
+                f"{train.suppression.to_station_name}"
+            )
+        else:
+            self._attr_native_value = None
+        self.async_write_ha_state()
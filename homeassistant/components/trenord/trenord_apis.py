@@ -0,0 +1,235 @@
+"""Client for the Trenord train APIs."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from enum import Enum
+import logging
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+from homeassistant.helpers.json import json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+_ROME = ZoneInfo("Europe/Rome")
+
+_URL = "https://admin.trenord.it/store-management-api/mia/train/{}?date={}"
+_DT_FMT = "%Y%m%d%H:%M:%S"
+
+
+class TrainStatus(Enum):
+    """Overall status of a train."""
+
+    NONE = "none"
+    TRAVELLING = "travelling"
+    CANCELLED = "cancelled"
+
+
+class TrainStationType(Enum):
+    """Role of a station within a train journey."""
+
+    ORIGIN = "origin"
+    STOP = "stop"
+    DESTINATION = "destination"
+
+
+_STATION_TYPES = {
+    "O": TrainStationType.ORIGIN,
+    "D": TrainStationType.DESTINATION,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TrenordTrainSuppression:
+    """Suppression of a part of a train journey."""
+
+    from_station_id: str
+    from_station_name: str
+    to_station_id: str
+    to_station_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class TrenordTrainCurrentStation:
+    """Last station a train has transited through."""
+
+    station_id: str
+    station_name: str
+    station_type: TrainStationType
+
+
+@dataclass(frozen=True, slots=True)
+class TrenordTrain:
+    """A Trenord train.
+
+    Slots keep the per-poll instances small and the generated __eq__
+    gives the value equality the coordinator's update gate relies on.
+    """
+
+    train_id: str
+    line: str
+    train_name: str
+    departure_station: str
+    direction: str
+    status: TrainStatus
+    delay: int
+    departure_time: datetime
+    arrival_time: datetime
+    departure_station_id: str
+    arrival_station_id: str
+    suppression: TrenordTrainSuppression | None = None
+    current_station: TrenordTrainCurrentStation | None = None
+    # Derived from arrival_time; excluded from equality.
+    arrival_ts: float = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the timestamp used in hot-path comparisons."""
+        object.__setattr__(self, "arrival_ts", self.arrival_time.timestamp())
+
+    @property
+    def name(self) -> str:
+        """Human readable name of the train, built on demand.
+
+        With the unchanged-payload gate in the coordinator this only
+        runs when a sensor actually rewrites its state; slots rule out
+        functools.cached_property here.
+        """
+        return (
+            f"{self.line} {self.train_name} - "
+            f"{self.departure_time.strftime('%H:%M')} da {self.departure_station} "
+            f"per {self.direction.capitalize()}"
+        )
+
+
+class TrenordApi:
+    """Client of the Trenord train APIs."""
+
+    def __init__(self, session: aiohttp.ClientSession) -> None:
+        """Initialize the client with a shared aiohttp session."""
+        self._session = session
+
+    async def get_train(self, train_id: str) -> TrenordTrain | None:
+        """Fetch a train by its id."""
+        url = _URL.format(train_id, date.today().isoformat())
+
+        async with self._session.get(
+            url, timeout=aiohttp.ClientTimeout(total=10)
+        ) as response:
+            response.raise_for_status()
+            payload = json_loads(await response.read())
+
+        if not payload:
+            return None
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(payload[0])
+
+        json = payload[0]
+
+        pass_list = json["pass_list"]
+        first_stop = pass_list[0]
+        last_stop = pass_list[-1]
+
+        departure_time = self._parse_datetime(f"{json['date']}{first_stop['dep_time']}")
+        arrival_time = self._parse_datetime(f"{json['date']}{last_stop['arr_time']}")
+
+        suppression = self._get_suppression(json)
+        current_station = self._get_current_station(pass_list)
+
+        train_dto = TrenordTrain(
+            train_id,
+            json["line_mnemonic"],
+            json["train_name"],
+            first_stop["station"]["name"],
+            json["direction"],
+            self._get_status(
+                json["status"],
+                json["cancelled"],
+                suppression,
+                current_station,
+                first_stop["station"]["mir"],
+                last_stop["station"]["mir"],
+            ),
+            json["delay"],
+            departure_time,
+            arrival_time,
+            first_stop["station"]["mir"],
+            last_stop["station"]["mir"],
+            suppression,
+            current_station,
+        )
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Train: %s", asdict(train_dto))
+
+        return train_dto
+
+    def _parse_datetime(self, value: str) -> datetime:
+        """Parse a date and time string from the APIs into a datetime."""
+        return datetime.strptime(value, _DT_FMT).replace(tzinfo=_ROME)
+
+    def _get_suppression(self, train: dict) -> TrenordTrainSuppression | None:
+        """Extract the suppression from a train payload, if present."""
+        if "suppression_start_mir" not in train:
+            return None
+
+        return TrenordTrainSuppression(
+            train["suppression_start_mir"],
+            train["suppression_start_name"],
+            train["suppression_end_mir"],
+            train["suppression_end_name"],
+        )
+
+    def _get_current_station(
+        self, train_pass_list: list[dict]
+    ) -> TrenordTrainCurrentStation | None:
+        """Extract the last transited station from the pass list."""
+        last = None
+        for stop in train_pass_list:
+            actual_data = stop.get("actual_data")
+            if (
+                stop["cancelled"]
+                or not actual_data
+                or "actual_station_mir" not in actual_data
+                or "actual_station_name" not in actual_data
+            ):
+                break
+            last = stop
+
+        if last is None:
+            return None
+
+        actual_data = last["actual_data"]
+
+        return TrenordTrainCurrentStation(
+            actual_data["actual_station_mir"],
+            actual_data["actual_station_name"],
+            _STATION_TYPES.get(last["type"], TrainStationType.STOP),
+        )
+
+    def _get_status(
+        self,
+        train_status: str,
+        cancelled: bool,
+        suppression: TrenordTrainSuppression | None,
+        current_station: TrenordTrainCurrentStation | None,
+        departure_station_id: str,
+        arrival_station_id: str,
+    ) -> TrainStatus:
+        """Compute the overall status of a train."""
+        station_type = current_station.station_type if current_station else None
+        if station_type is TrainStationType.DESTINATION:
+            return TrainStatus.NONE
+
+        if suppression is not None and (
+            suppression.from_station_id,
+            suppression.to_station_id,
+        ) == (departure_station_id, arrival_station_id):
+            return TrainStatus.CANCELLED
+
+        if cancelled:
+            return TrainStatus.CANCELLED
+
+        return TrainStatus.TRAVELLING if train_status == "V" else TrainStatus.NONE
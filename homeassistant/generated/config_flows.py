@@ -437,6 +437,7 @@ FLOWS = {
         "trafikverket_train",
         "trafikverket_weatherstation",
         "transmission",
+        "trenord",
         "tuya",
         "twentemilieu",
         "twilio",
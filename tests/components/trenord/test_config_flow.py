@@ -0,0 +1,144 @@
+"""Test the Trenord config flow."""
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import aiohttp
+
+from homeassistant import config_entries
+from homeassistant.components.trenord.const import (
+    CONF_ARRIVAL_TIME,
+    CONF_DEPARTURE_TIME,
+    CONF_TRAIN_ID,
+    DOMAIN,
+)
+from homeassistant.components.trenord.trenord_apis import TrainStatus, TrenordTrain
+from homeassistant.const import CONF_NAME
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from tests.common import MockConfigEntry
+
+TRAIN = TrenordTrain(
+    "2611",
+    "R17",
+    "2611",
+    "Milano Cadorna",
+    "COMO LAGO",
+    TrainStatus.NONE,
+    0,
+    datetime(2023, 1, 25, 8, 37, tzinfo=ZoneInfo("Europe/Rome")),
+    datetime(2023, 1, 25, 9, 40, tzinfo=ZoneInfo("Europe/Rome")),
+    "N00001",
+    "N00030",
+    None,
+    None,
+)
+
+
+async def test_form(hass: HomeAssistant) -> None:
+    """Test we get the form and can create an entry."""
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {}
+
+    with patch(
+        "homeassistant.components.trenord.config_flow.TrenordApi.get_train",
+        return_value=TRAIN,
+    ), patch(
+        "homeassistant.components.trenord.async_setup_entry",
+        return_value=True,
+    ) as mock_setup_entry:
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_TRAIN_ID: "2611"},
+        )
+        await hass.async_block_till_done()
+
+    assert result2["type"] == FlowResultType.CREATE_ENTRY
+    assert result2["title"] == "R17 2611 - 08:37 da Milano Cadorna per Como lago"
+    assert result2["data"] == {
+        CONF_NAME: "R17 2611 - 08:37 da Milano Cadorna per Como lago",
+        CONF_TRAIN_ID: "2611",
+        CONF_DEPARTURE_TIME: 1674632220,
+        CONF_ARRIVAL_TIME: 1674636000,
+    }
+    assert len(mock_setup_entry.mock_calls) == 1
+    assert result2["result"].unique_id == "2611"
+
+
+async def test_form_train_not_found(hass: HomeAssistant) -> None:
+    """Test we handle an unknown train id."""
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "homeassistant.components.trenord.config_flow.TrenordApi.get_train",
+        return_value=None,
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_TRAIN_ID: "0000"},
+        )
+
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["errors"] == {"base": "train_not_found"}
+
+
+async def test_form_cannot_connect(hass: HomeAssistant) -> None:
+    """Test we handle a connection failure."""
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "homeassistant.components.trenord.config_flow.TrenordApi.get_train",
+        side_effect=aiohttp.ClientError,
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_TRAIN_ID: "2611"},
+        )
+
+    assert result2["type"] == FlowResultType.FORM
+    assert result2["errors"] == {"base": "cannot_connect"}
+
+
+async def test_form_entry_already_exist(hass: HomeAssistant) -> None:
+    """Test flow aborts when the train is already configured."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_NAME: "R17 2611 - 08:37 da Milano Cadorna per Como lago",
+            CONF_TRAIN_ID: "2611",
+            CONF_DEPARTURE_TIME: 1674632220,
+            CONF_ARRIVAL_TIME: 1674636000,
+        },
+        unique_id="2611",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    with patch(
+        "homeassistant.components.trenord.config_flow.TrenordApi.get_train",
+        return_value=TRAIN,
+    ):
+        result2 = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_TRAIN_ID: "2611"},
+        )
+
+    assert result2["type"] == FlowResultType.ABORT
+    assert result2["reason"] == "already_configured"
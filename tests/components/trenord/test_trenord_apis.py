@@ -0,0 +1,141 @@
+"""Test the Trenord API client helpers."""
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+from homeassistant.components.trenord.trenord_apis import (
+    TrainStationType,
+    TrainStatus,
+    TrenordApi,
+    TrenordTrain,
+    TrenordTrainCurrentStation,
+    TrenordTrainSuppression,
+)
+
+_ROME = ZoneInfo("Europe/Rome")
+
+
+def _train(**overrides) -> TrenordTrain:
+    """Build a train DTO with sensible defaults."""
+    fields = {
+        "train_id": "2611",
+        "line": "R17",
+        "train_name": "2611",
+        "departure_station": "Milano Cadorna",
+        "direction": "COMO LAGO",
+        "status": TrainStatus.TRAVELLING,
+        "delay": 3,
+        "departure_time": datetime(2023, 1, 25, 8, 37, tzinfo=_ROME),
+        "arrival_time": datetime(2023, 1, 25, 9, 40, tzinfo=_ROME),
+        "departure_station_id": "N00001",
+        "arrival_station_id": "N00030",
+        "suppression": TrenordTrainSuppression("N00005", "Saronno", "N00030", "Como"),
+        "current_station": TrenordTrainCurrentStation(
+            "N00005", "Saronno", TrainStationType.STOP
+        ),
+    }
+    fields.update(overrides)
+    return TrenordTrain(**fields)
+
+
+def test_train_equality_cascades_through_nested_dtos() -> None:
+    """Identical payloads compare equal even with nested DTO instances."""
+    assert _train() == _train()
+    assert hash(_train()) == hash(_train())
+
+
+def test_train_name_is_derived_from_raw_fields() -> None:
+    """The display name is built from the raw schedule fields."""
+    assert _train().name == "R17 2611 - 08:37 da Milano Cadorna per Como lago"
+
+
+def test_train_arrival_timestamp_is_precomputed() -> None:
+    """The arrival timestamp mirrors arrival_time without affecting equality."""
+    train = _train()
+    assert train.arrival_ts == train.arrival_time.timestamp()
+
+
+def test_train_equality_detects_changes() -> None:
+    """Any changed field, including nested ones, breaks equality."""
+    assert _train(delay=5) != _train()
+    assert _train(suppression=None) != _train()
+    assert (
+        _train(
+            current_station=TrenordTrainCurrentStation(
+                "N00030", "Como", TrainStationType.DESTINATION
+            )
+        )
+        != _train()
+    )
+
+
+def test_get_current_station_returns_last_transited_stop() -> None:
+    """The last stop with actual data before a gap wins."""
+    api = TrenordApi(Mock())
+    pass_list = [
+        {
+            "cancelled": False,
+            "type": "O",
+            "actual_data": {
+                "actual_station_mir": "N00001",
+                "actual_station_name": "Milano Cadorna",
+            },
+        },
+        {
+            "cancelled": False,
+            "type": "F",
+            "actual_data": {
+                "actual_station_mir": "N00005",
+                "actual_station_name": "Saronno",
+            },
+        },
+        {"cancelled": False, "type": "D", "actual_data": None},
+    ]
+
+    station = api._get_current_station(pass_list)
+
+    assert station == TrenordTrainCurrentStation(
+        "N00005", "Saronno", TrainStationType.STOP
+    )
+
+
+def test_get_current_station_without_actual_data() -> None:
+    """No transited stop yields None."""
+    api = TrenordApi(Mock())
+
+    assert api._get_current_station([{"cancelled": True, "type": "O"}]) is None
+
+
+def test_get_status() -> None:
+    """The overall status follows destination/suppression/cancel rules."""
+    api = TrenordApi(Mock())
+    at_destination = TrenordTrainCurrentStation(
+        "N00030", "Como", TrainStationType.DESTINATION
+    )
+    full_suppression = TrenordTrainSuppression("N00001", "Milano", "N00030", "Como")
+
+    assert api._get_status("V", False, None, at_destination, "N00001", "N00030") is (
+        TrainStatus.NONE
+    )
+    assert api._get_status("V", False, full_suppression, None, "N00001", "N00030") is (
+        TrainStatus.CANCELLED
+    )
+    assert api._get_status("V", True, None, None, "N00001", "N00030") is (
+        TrainStatus.CANCELLED
+    )
+    assert api._get_status("V", False, None, None, "N00001", "N00030") is (
+        TrainStatus.TRAVELLING
+    )
+    assert api._get_status("", False, None, None, "N00001", "N00030") is (
+        TrainStatus.NONE
+    )
+
+
+def test_parse_datetime() -> None:
+    """API date strings parse into Europe/Rome datetimes."""
+    parsed = TrenordApi(Mock())._parse_datetime("2023012508:37:00")
+
+    assert parsed == datetime(2023, 1, 25, 8, 37, tzinfo=_ROME)
+    assert parsed.utcoffset() == datetime(2023, 1, 25, tzinfo=_ROME).utcoffset()